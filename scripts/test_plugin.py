@@ -54,7 +54,7 @@ for resolution in RESOLUTIONS:
         img = resize_image(img, resolution, plugin_config.get('image_settings', []))
         # rotate the image again when pasting
         if orientation == "vertical":
-            img = img.rotate(-90, expand=1)
+            img = img.transpose(Image.Transpose.ROTATE_270)
         composite.paste(img, (x, y))
         x= int(total_width/2)
     y+= max(width, height)
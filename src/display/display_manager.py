@@ -1,8 +1,11 @@
 import fnmatch
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from utils.image_utils import resize_image, change_orientation, apply_image_enhancement
+from utils.image_utils import orient_and_resize, apply_image_enhancement
 from display.mock_display import MockDisplay
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,9 @@ class DisplayManager:
         Initializes the display manager and selects the correct display type 
         based on the configuration.
 
+        The display itself is initialized on first use, see `_init_display`, unless the
+        resolution isn't configured yet and has to be read from the device.
+
         Args:
             device_config (object): Configuration object containing display settings.
 
@@ -36,13 +42,20 @@ class DisplayManager:
         """
         
         self.device_config = device_config
+
+        # Current image is written in the background so the display update isn't delayed
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-save")
+        self._save_future = None
+        self._last_saved_hash = None
+        # display_image is called from both the web and refresh threads
+        self._save_lock = threading.Lock()
      
         display_type = device_config.get_config("display_type", default="inky")
 
         if display_type == "mock":
-            self.display = MockDisplay(device_config)
+            self._display_class = MockDisplay
         elif display_type == "inky":
-            self.display = InkyDisplay(device_config)
+            self._display_class = InkyDisplay
         elif fnmatch.fnmatch(display_type, "epd*in*"):  
             # derived from waveshare epd - we assume here that will be consistent
             # otherwise we will have to enshring the manufacturer in the 
@@ -50,35 +63,102 @@ class DisplayManager:
             # that for future use if the need arises.
             #
             # see https://github.com/waveshareteam/e-Paper
-            self.display = WaveshareDisplay(device_config)
+            self._display_class = WaveshareDisplay
         else:
             raise ValueError(f"Unsupported display type: {display_type}")
 
-    def display_image(self, image, image_settings=[]):
+        self._display = None
+        self._display_lock = threading.Lock()
+
+        # displays store the resolution in the device config when they are initialized
+        if not device_config.get_config("resolution"):
+            self._init_display()
+
+        # the resolution doesn't change after the display is initialized
+        self._target_size = device_config.get_resolution()
+
+    @property
+    def display(self):
+        """The display instance, initialized on first access."""
+        return self._init_display()
+
+    def _init_display(self):
+        """Initializes the display instance if it hasn't been yet and returns it."""
+        with self._display_lock:
+            if self._display is None:
+                self._display = self._display_class(self.device_config)
+        return self._display
+
+    def initialize_display_async(self):
+        """Initializes the display on a background thread so it overlaps with other startup work."""
+        threading.Thread(target=self._init_display_in_background, name="display-init", daemon=True).start()
+
+    def _init_display_in_background(self):
+        """Initializes the display, logging a failure since the next display_image retries it."""
+        try:
+            self._init_display()
+        except Exception:
+            logger.exception("Failed to initialize display in the background, retrying on the next update")
+
+    def display_image(self, image, image_settings=[], image_hash=None):
         
         """
-        Delegates image rendering to the appropriate display instance.
+        Delegates image rendering to the appropriate display instance, initializing it first if needed.
 
         Args:
             image (PIL.Image): The image to be displayed.
             image_settings (list, optional): List of settings to modify image rendering.
-
-        Raises:
-            ValueError: If no valid display instance is found.
+            image_hash (str, optional): Hash of the image, used to skip saving an unchanged image.
         """
 
-        if not hasattr(self, "display"):
-            raise ValueError("No valid display instance initialized.")
-        
+        display = self._init_display()
+
         # Save the image
-        logger.info(f"Saving image to {self.device_config.current_image_file}")
-        image.save(self.device_config.current_image_file)
+        self.save_current_image(image, image_hash)
 
         # Resize and adjust orientation
-        image = change_orientation(image, self.device_config.get_config("orientation"))
-        image = resize_image(image, self.device_config.get_resolution(), image_settings)
-        if self.device_config.get_config("inverted_image"): image = image.rotate(180)
+        image = orient_and_resize(image, self.device_config.get_config("orientation"),
+                                  self._target_size, image_settings,
+                                  inverted=self.device_config.get_config("inverted_image"))
         image = apply_image_enhancement(image, self.device_config.get_config("image_settings"))
 
         # Pass to the concrete instance to render to the device.
-        self.display.display_image(image, image_settings)
\ No newline at end of file
+        display.display_image(image, image_settings)
+
+    def save_current_image(self, image, image_hash=None):
+
+        """
+        Saves the image to the current image file on a background thread.
+
+        The save is skipped when the image hash matches the last saved image. Any
+        previous save is finished first so writes never overlap, and the check and
+        submit are done under a lock so concurrent callers can't race each other.
+
+        Args:
+            image (PIL.Image): The image to be saved.
+            image_hash (str, optional): Hash of the image, if already computed.
+        """
+
+        with self._save_lock:
+            if self._save_future:
+                self._save_future.result()
+
+            if image_hash is not None and image_hash == self._last_saved_hash:
+                logger.info("Image unchanged, skipping save of current image")
+                return
+
+            logger.info(f"Saving image to {self.device_config.current_image_file}")
+            self._last_saved_hash = image_hash
+            self._save_future = self._save_executor.submit(self._write_image, image, self.device_config.current_image_file)
+
+    def _write_image(self, image, path):
+        """Writes the image to a temporary file and moves it into place so readers never see a partial file."""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                image.save(f, format="PNG", optimize=False, compress_level=1)
+            os.replace(tmp_path, path)
+        except Exception:
+            logger.exception(f"Failed to save image to {path}")
+            # no lock needed, the next save waits for this one before reading or setting the hash
+            self._last_saved_hash = None
@@ -11,21 +11,26 @@ from plugins.plugin_registry import get_plugin_instance
 logger = logging.getLogger(__name__)
 
 
+# Palette for bi-color (black and red) e-paper displays, built once and reused for every image
+BI_COLOR_PALETTE_IMAGE = Image.new('P', (1, 1))
+BI_COLOR_PALETTE_IMAGE.putpalette([
+    0, 0, 0,        # black
+    255, 255, 255,  # white
+    255, 0, 0       # red
+])
+
+# Lookup tables mapping palette indices to the 1-bit layers, 0 where the colour is drawn
+BLACK_LAYER_TABLE = [0 if p == 0 else 1 for p in range(256)]
+RED_LAYER_TABLE = [0 if p == 2 else 1 for p in range(256)]
+
+
 def split_image_for_bi_color_epd(image):
     """
     Convert image into two 1-bit layers for bi-color (black and red) e-paper displays.
     """
-    black = (0, 0, 0)
-    white = (255, 255, 255)
-    red = (255, 0, 0)
-
-    palette_data = [*black, *white, *red]
-    palette_img = Image.new('P', (1, 1))
-    palette_img.putpalette(palette_data)
-
-    indexed_img = image.quantize(palette=palette_img, dither=Image.Dither.FLOYDSTEINBERG)
-    black_layer = indexed_img.point(lambda p: 0 if p == 0 else 1, mode='1')
-    red_layer = indexed_img.point(lambda p: 0 if p == 2 else 1, mode='1')
+    indexed_img = image.quantize(palette=BI_COLOR_PALETTE_IMAGE, dither=Image.Dither.FLOYDSTEINBERG)
+    black_layer = indexed_img.point(BLACK_LAYER_TABLE, mode='1')
+    red_layer = indexed_img.point(RED_LAYER_TABLE, mode='1')
     return black_layer, red_layer
 
 
@@ -19,6 +19,7 @@ import json
 import logging
 import threading
 import argparse
+from PIL import Image
 from utils.app_utils import generate_startup_image
 from flask import Flask, request, send_from_directory
 from werkzeug.serving import is_running_from_reloader
@@ -60,6 +61,9 @@ template_dirs = [
 ]
 app.jinja_loader = ChoiceLoader([FileSystemLoader(directory) for directory in template_dirs])
 
+# Load Pillow's common image format plugins now rather than on the first image save/open
+Image.preinit()
+
 device_config = Config()
 display_manager = DisplayManager(device_config)
 refresh_task = RefreshTask(device_config, display_manager)
@@ -89,6 +93,9 @@ if __name__ == '__main__':
     # start the background refresh task
     refresh_task.start()
 
+    # initialize the display while the startup image is generated
+    display_manager.initialize_display_async()
+
     # display default inkypi image on startup
     logger.info("Startup flag is set, displaying startup image")
     img = generate_startup_image(device_config.get_resolution())
@@ -10,7 +10,7 @@ class RefreshInfo:
 
     Attributes:
         refresh_time (str): ISO-formatted time string of the refresh.
-        image_hash (int): SHA-256 hash of the image.
+        image_hash (str): Hash of the displayed image, see compute_image_hash.
         refresh_type (str): Refresh type ['Manual Update', 'Playlist'].
         plugin_id (str): Plugin id of the refresh.
         playlist (str): Playlist name if refresh_type is 'Playlist'.
@@ -46,6 +46,10 @@ class RefreshInfo:
             refresh_dict["plugin_instance"] = self.plugin_instance
         return refresh_dict
 
+    def __repr__(self):
+        """Formats as the to_dict() representation, only built when a log record is emitted."""
+        return repr(self.to_dict())
+
     @classmethod
     def from_dict(cls, data):
         return cls(
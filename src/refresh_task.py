@@ -1,5 +1,6 @@
 import threading
 import time
+import queue
 import os
 import logging
 import psutil
@@ -12,6 +13,50 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Default seconds manual_update waits for its refresh, including time queued behind earlier requests.
+# Covers a slow plugin on a Pi Zero (e.g. a Chromium screenshot) plus a full 7-colour or Spectra
+# e-paper refresh, which alone takes 30-40 seconds. Configurable with "manual_update_timeout_seconds".
+MANUAL_UPDATE_TIMEOUT_SECONDS = 300
+
+# Queued to wake the background thread without a manual update, e.g. on stop or a config change
+_WAKE = object()
+
+# Returned by a refresh action's execute() instead of an image when it knows the displayed image is still current
+NO_CHANGE = object()
+
+def _hash_image(image):
+    """Returns the hash of the image, reusing the value cached on the image object when present."""
+    image_hash = getattr(image, "_inkypi_hash", None)
+    if image_hash is None:
+        image_hash = compute_image_hash(image)
+        image._inkypi_hash = image_hash
+    return image_hash
+
+class ManualUpdateRequest:
+    """A manual refresh handed to the background thread, along with the result its caller waits on."""
+
+    def __init__(self, refresh_action):
+        self.refresh_action = refresh_action
+        self.done = threading.Event()
+        self.exception = None
+        self.started = False
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Marks the request as started, returns False if its caller already cancelled it."""
+        with self._lock:
+            if not self.cancelled:
+                self.started = True
+            return self.started
+
+    def cancel(self):
+        """Cancels the request unless it already started, returns whether it was cancelled."""
+        with self._lock:
+            if not self.started:
+                self.cancelled = True
+            return self.cancelled
+
 class RefreshTask:
     """Handles the logic for refreshing the display using a background thread."""
 
@@ -20,14 +65,22 @@ class RefreshTask:
         self.display_manager = display_manager
 
         self.thread = None
-        self.lock = threading.Lock()
-        self.condition = threading.Condition(self.lock)
         self.running = False
-        self.manual_update_request = ()
+        self._lock = threading.Lock()  # orders queuing manual updates against stop()
+
+        # Manual update requests, processed in order. Waiting on the queue is also how the
+        # background thread sleeps, so queuing anything (see _WAKE) wakes it up.
+        self._queue = queue.SimpleQueue()
+
+        # Image object last sent to the display, lets an action returning it skip the hash comparison
+        self._last_displayed_image = None
 
-        self.refresh_event = threading.Event()
-        self.refresh_event.set()
-        self.refresh_result = {}
+        # Timezone of the last refresh, rebuilt only when the configured timezone changes
+        self._tz_str = None
+        self._tz = None
+
+        # Prime the CPU usage counter so log_system_stats can sample it without blocking
+        psutil.cpu_percent(interval=None)
 
     def start(self):
         """Starts the background thread for refreshing the display."""
@@ -39,9 +92,9 @@ class RefreshTask:
 
     def stop(self):
         """Stops the refresh task by notifying the background thread to exit."""
-        with self.condition:
+        with self._lock:
             self.running = False
-            self.condition.notify_all()  # Wake the thread to let it exit
+            self._queue.put(_WAKE)  # Wake the thread to let it exit
         if self.thread:
             logger.info("Stopping refresh task")
             self.thread.join()
@@ -54,7 +107,7 @@ class RefreshTask:
         updates the display accordingly.
 
         Workflow:
-        1. Waits for the configured sleep duration or until notified of a manual update.
+        1. Waits for the configured sleep duration or until a manual update is queued.
         2. Checks if a manual update has been requested:
         - If so, refreshes the specified plugin immediately.
         3. Otherwise, determines the next plugin to refresh based on the active playlist and generates an image.
@@ -64,154 +117,214 @@ class RefreshTask:
         5. Updates the refresh metadata in the device configuration.
         6. Repeats the process until `stop()` is called.
 
-        Handles any exceptions that occur during the refresh process and ensures the refresh event is set 
-        to indicate completion.
+        Handles any exceptions that occur during the refresh process and ensures a manual update request
+        is marked done to indicate completion.
 
         Exceptions:
         - Captures and logs any unexpected errors during execution to prevent the thread from exiting.
         """
+        sleep_time = self.device_config.get_config("plugin_cycle_interval_seconds", default=60*60)
         while True:
+            manual_request = None
             try:
-                with self.condition:
-                    sleep_time = self.device_config.get_config("plugin_cycle_interval_seconds", default=60*60)
-
-                    # Wait for sleep_time or until notified
-                    self.condition.wait(timeout=sleep_time)
-                    self.refresh_result = {}
-                    self.refresh_event.clear()
-
-                    # Exit if `stop()` is called
-                    if not self.running:
-                        break
-
-                    playlist_manager = self.device_config.get_playlist_manager()
-                    latest_refresh = self.device_config.get_refresh_info()
-                    current_dt = self._get_current_datetime()
-
-                    refresh_action = None
-                    if self.manual_update_request:
-                        # handle immediate update request
-                        logger.info("Manual update requested")
-                        refresh_action = self.manual_update_request
-                        self.manual_update_request = ()
+                # Wait for sleep_time or until something is queued
+                try:
+                    item = self._queue.get(timeout=sleep_time)
+                except queue.Empty:
+                    item = None
+
+                if isinstance(item, ManualUpdateRequest):
+                    manual_request = item
+
+                # Exit if `stop()` is called
+                if not self.running:
+                    if manual_request:
+                        manual_request.exception = RuntimeError("Refresh task stopped before the update was processed")
+                    break
+
+                # read the interval once per cycle, after waking up so changes are picked up,
+                # it is also how long to sleep before the next cycle
+                plugin_cycle_interval = self.device_config.get_config("plugin_cycle_interval_seconds", default=60*60)
+                sleep_time = plugin_cycle_interval
+
+                if manual_request and not manual_request.start():
+                    logger.info("Skipping manual update cancelled after its caller timed out.")
+                    continue
+
+                playlist_manager = self.device_config.get_playlist_manager()
+                latest_refresh = self.device_config.get_refresh_info()
+                current_dt = self._get_current_datetime()
+
+                refresh_action = None
+                if manual_request:
+                    # handle immediate update request
+                    logger.info("Manual update requested")
+                    refresh_action = manual_request.refresh_action
+                else:
+
+                    if self.device_config.get_config("log_system_stats"):
+                        self.log_system_stats()
+
+                    # handle refresh based on playlists
+                    logger.info("Running interval refresh check. | current_time: %s", current_dt.strftime('%Y-%m-%d %H:%M:%S'))
+                    playlist, plugin_instance = self._determine_next_plugin(playlist_manager, latest_refresh, current_dt, plugin_cycle_interval)
+                    if plugin_instance:
+                        refresh_action = PlaylistRefresh(playlist, plugin_instance)
+
+                if refresh_action:
+                    plugin_config = self.device_config.get_plugin(refresh_action.get_plugin_id())
+                    if plugin_config is None:
+                        logger.error("Plugin config not found for '%s'.", refresh_action.get_plugin_id())
+                        continue
+                    plugin = get_plugin_instance(plugin_config)
+                    image = refresh_action.execute(plugin, self.device_config, current_dt)
+                    if image is NO_CHANGE or image is self._last_displayed_image:
+                        logger.debug("Refresh action returned the displayed image, skipping image hash.")
+                        image_hash = latest_refresh.image_hash
+                    else:
+                        image_hash = _hash_image(image)
+
+                    refresh_info = refresh_action.get_refresh_info_obj(current_dt, image_hash)
+                    # check if image is the same as current image
+                    if image_hash != latest_refresh.image_hash:
+                        logger.info("Updating display. | refresh_info: %s", refresh_info)
+                        self.display_manager.display_image(image, image_settings=plugin.config.get("image_settings", []), image_hash=image_hash)
+                        self._last_displayed_image = image
                     else:
+                        logger.info("Image already displayed, skipping refresh. | refresh_info: %s", refresh_info)
 
-                        if self.device_config.get_config("log_system_stats"):
-                            self.log_system_stats()
-
-                        # handle refresh based on playlists
-                        logger.info(f"Running interval refresh check. | current_time: {current_dt.strftime('%Y-%m-%d %H:%M:%S')}")
-                        playlist, plugin_instance = self._determine_next_plugin(playlist_manager, latest_refresh, current_dt)
-                        if plugin_instance:
-                            refresh_action = PlaylistRefresh(playlist, plugin_instance)
-
-                    if refresh_action:
-                        plugin_config = self.device_config.get_plugin(refresh_action.get_plugin_id())
-                        if plugin_config is None:
-                            logger.error(f"Plugin config not found for '{refresh_action.get_plugin_id()}'.")
-                            continue
-                        plugin = get_plugin_instance(plugin_config)
-                        image = refresh_action.execute(plugin, self.device_config, current_dt)
-                        image_hash = compute_image_hash(image)
-
-                        refresh_info = refresh_action.get_refresh_info()
-                        refresh_info.update({"refresh_time": current_dt.isoformat(), "image_hash": image_hash})
-                        # check if image is the same as current image
-                        if image_hash != latest_refresh.image_hash:
-                            logger.info(f"Updating display. | refresh_info: {refresh_info}")
-                            self.display_manager.display_image(image, image_settings=plugin.config.get("image_settings", []))
-                        else:
-                            logger.info(f"Image already displayed, skipping refresh. | refresh_info: {refresh_info}")
-
-                        # update latest refresh data in the device config
-                        self.device_config.refresh_info = RefreshInfo(**refresh_info)
-                        self.device_config.write_config()
+                    # update latest refresh data in the device config, the refresh time and
+                    # playlist position are needed for scheduling even when the image didn't change
+                    self.device_config.refresh_info = refresh_info
+                    self.device_config.write_config()
 
             except Exception as e:
                 logger.exception('Exception during refresh')
-                self.refresh_result["exception"] = e  # Capture exception
+                if manual_request:
+                    manual_request.exception = e  # Capture exception
             finally:
-                self.refresh_event.set()
+                if manual_request:
+                    manual_request.done.set()
 
-    def manual_update(self, refresh_action):
-        """Manually triggers an update for the specified plugin id and plugin settings by notifying the background process."""
-        if self.running:
-            with self.condition:
-                self.manual_update_request = refresh_action
-                self.refresh_result = {}
-                self.refresh_event.clear()
+        # Release callers whose requests were still queued when stopped
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, ManualUpdateRequest):
+                item.exception = RuntimeError("Refresh task stopped before the update was processed")
+                item.done.set()
+
+    def manual_update(self, refresh_action, timeout=None):
+        """Manually triggers an update for the specified plugin id and plugin settings by notifying the background process.
+
+        Waits up to `timeout` seconds, by default the "manual_update_timeout_seconds" config or
+        MANUAL_UPDATE_TIMEOUT_SECONDS, for the refresh to complete and raises TimeoutError if it doesn't,
+        so a hanging plugin can't block the calling request thread forever. A request that hasn't
+        started by then is cancelled, so the display doesn't change after the caller reported an error.
+        """
+        if timeout is None:
+            timeout = self.device_config.get_config("manual_update_timeout_seconds", default=MANUAL_UPDATE_TIMEOUT_SECONDS)
 
-                self.condition.notify_all()  # Wake the thread to process manual update
+        request = ManualUpdateRequest(refresh_action)
+        # Checked under the lock so a request can't be queued after stop() and never be processed
+        with self._lock:
+            queued = self.running
+            if queued:
+                self._queue.put(request)  # Wakes the thread to process manual update
 
-            self.refresh_event.wait()
-            if self.refresh_result.get("exception"):
-                raise self.refresh_result.get("exception")
-        else:
+        if not queued:
             logger.warning("Background refresh task is not running, unable to do a manual update")
+            return
+
+        if not request.done.wait(timeout):
+            if request.cancel():
+                raise TimeoutError(f"Refresh did not start within {timeout}s and was cancelled")
+            # the refresh may have finished between the wait timing out and the cancel
+            if not request.done.is_set():
+                raise TimeoutError(f"Refresh did not complete within {timeout}s, the display will update when it finishes")
+        if request.exception:
+            raise request.exception
 
     def signal_config_change(self):
         """Notify the background thread that config has changed (e.g., interval updated)."""
         if self.running:
-            with self.condition:
-                self.condition.notify_all()
+            self._queue.put(_WAKE)
 
     def _get_current_datetime(self):
         """Retrieves the current datetime based on the device's configured timezone."""
         tz_str = self.device_config.get_config("timezone", default="UTC")
-        return datetime.now(pytz.timezone(tz_str))
+        if tz_str != self._tz_str:
+            self._tz = pytz.timezone(tz_str)
+            self._tz_str = tz_str
+        return datetime.now(self._tz)
 
-    def _determine_next_plugin(self, playlist_manager, latest_refresh_info, current_dt):
+    def _determine_next_plugin(self, playlist_manager, latest_refresh_info, current_dt, plugin_cycle_interval):
         """Determines the next plugin to refresh based on the active playlist, plugin cycle interval, and current time."""
         playlist = playlist_manager.determine_active_playlist(current_dt)
         if not playlist:
             playlist_manager.active_playlist = None
-            logger.info(f"No active playlist determined.")
+            logger.info("No active playlist determined.")
             return None, None
 
         playlist_manager.active_playlist = playlist.name
         if not playlist.plugins:
-            logger.info(f"Active playlist '{playlist.name}' has no plugins.")
+            logger.info("Active playlist '%s' has no plugins.", playlist.name)
             return None, None
 
         latest_refresh_dt = latest_refresh_info.get_refresh_datetime()
-        plugin_cycle_interval = self.device_config.get_config("plugin_cycle_interval_seconds", default=3600)
         should_refresh = PlaylistManager.should_refresh(latest_refresh_dt, plugin_cycle_interval, current_dt)
 
         if not should_refresh:
             latest_refresh_str = latest_refresh_dt.strftime('%Y-%m-%d %H:%M:%S') if latest_refresh_dt else "None"
-            logger.info(f"Not time to update display. | latest_update: {latest_refresh_str} | plugin_cycle_interval: {plugin_cycle_interval}")
+            logger.info("Not time to update display. | latest_update: %s | plugin_cycle_interval: %s", latest_refresh_str, plugin_cycle_interval)
             return None, None
 
         plugin = playlist.get_next_plugin()
-        logger.info(f"Determined next plugin. | active_playlist: {playlist.name} | plugin_instance: {plugin.name}")
+        logger.info("Determined next plugin. | active_playlist: %s | plugin_instance: %s", playlist.name, plugin.name)
 
         return playlist, plugin
     
     def log_system_stats(self):
+        """Logs system usage. CPU usage is measured since the previous call rather than over a blocking interval."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        logger.info("System Stats: %s", SystemStats())
+
+class SystemStats:
+    """System usage metrics, collected only when the log record is formatted."""
+
+    def __str__(self):
+        net_io = psutil.net_io_counters()
         metrics = {
-            'cpu_percent': psutil.cpu_percent(interval=1),
+            'cpu_percent': psutil.cpu_percent(interval=None),
             'memory_percent': psutil.virtual_memory().percent,
             'disk_percent': psutil.disk_usage('/').percent,
             'load_avg_1_5_15': os.getloadavg(),
             'swap_percent': psutil.swap_memory().percent,
             'net_io': {
-                'bytes_sent': psutil.net_io_counters().bytes_sent,
-                'bytes_recv': psutil.net_io_counters().bytes_recv
+                'bytes_sent': net_io.bytes_sent,
+                'bytes_recv': net_io.bytes_recv
             }
         }
-
-        logger.info(f"System Stats: {metrics}")
+        return str(metrics)
 
 class RefreshAction:
     """Base class for a refresh action. Subclasses should override the methods below."""
     
     def refresh(self, plugin, device_config, current_dt):
-        """Perform a refresh operation and return the updated image."""
+        """Perform a refresh operation and return the updated image, or NO_CHANGE if the displayed image is still current."""
         raise NotImplementedError("Subclasses must implement the refresh method.")
     
     def get_refresh_info(self):
         """Return refresh metadata as a dictionary."""
         raise NotImplementedError("Subclasses must implement the get_refresh_info method.")
+
+    def get_refresh_info_obj(self, current_dt, image_hash):
+        """Return refresh metadata as a RefreshInfo for a refresh at current_dt that produced image_hash."""
+        return RefreshInfo(refresh_time=current_dt.isoformat(), image_hash=image_hash, **self.get_refresh_info())
     
     def get_plugin_id(self):
         """Return the plugin ID associated with this refresh."""
@@ -249,6 +362,10 @@ class PlaylistRefresh(RefreshAction):
         plugin_instance: The plugin instance to refresh.
     """
 
+    # The last generated plugin instance image as (image path, file mtime, image). Only one image is
+    # kept, so a refresh of that instance can reuse it and its cached hash instead of reloading it from disk.
+    last_image = (None, None, None)
+
     def __init__(self, playlist, plugin_instance, force=False):
         self.playlist = playlist
         self.plugin_instance = plugin_instance
@@ -274,15 +391,19 @@ class PlaylistRefresh(RefreshAction):
 
         # Check if a refresh is needed based on the plugin instance's criteria
         if self.plugin_instance.should_refresh(current_dt) or self.force:
-            logger.info(f"Refreshing plugin instance. | plugin_instance: '{self.plugin_instance.name}'") 
+            logger.info("Refreshing plugin instance. | plugin_instance: '%s'", self.plugin_instance.name)
             # Generate a new image
             image = plugin.generate_image(self.plugin_instance.settings, device_config)
             image.save(plugin_image_path)
             self.plugin_instance.latest_refresh_time = current_dt.isoformat()
+            _hash_image(image)
+            PlaylistRefresh.last_image = (plugin_image_path, os.path.getmtime(plugin_image_path), image)
         else:
-            logger.info(f"Not time to refresh plugin instance, using latest image. | plugin_instance: {self.plugin_instance.name}.")
-            # Load the existing image from disk
-            with Image.open(plugin_image_path) as img:
-                image = img.copy()
-
-        return image
\ No newline at end of file
+            logger.info("Not time to refresh plugin instance, using latest image. | plugin_instance: %s.", self.plugin_instance.name)
+            cached_path, cached_mtime, image = PlaylistRefresh.last_image
+            if cached_path != plugin_image_path or cached_mtime != os.path.getmtime(plugin_image_path):
+                # Load the existing image from disk
+                with Image.open(plugin_image_path) as img:
+                    image = img.copy()
+
+        return image
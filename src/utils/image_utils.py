@@ -8,6 +8,13 @@ import tempfile
 import subprocess
 import shutil
 
+# Try to import xxhash for faster image hashing, falling back to hashlib
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 def get_image(image_url):
@@ -19,19 +26,29 @@ def get_image(image_url):
         logger.error(f"Received non-200 response from {image_url}: status_code: {response.status_code}")
     return img
 
-def change_orientation(image, orientation, inverted=False):
-    if orientation == 'horizontal':
-        angle = 0
-    elif orientation == 'vertical':
-        angle = 90
+ROTATIONS = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270
+}
+
+def get_orientation_angle(orientation, inverted=False):
+    angle = 90 if orientation == 'vertical' else 0
 
     if inverted:
         angle = (angle + 180) % 360
 
-    return image.rotate(angle, expand=1)
+    return angle
 
-def resize_image(image, desired_size, image_settings=[]):
-    img_width, img_height = image.size
+def change_orientation(image, orientation, inverted=False):
+    angle = get_orientation_angle(orientation, inverted)
+    if not angle:
+        return image.copy()
+
+    return image.transpose(ROTATIONS[angle])
+
+def get_crop_box(image_size, desired_size, image_settings=[]):
+    img_width, img_height = image_size
     desired_width, desired_height = desired_size
     desired_width, desired_height = int(desired_width), int(desired_height)
 
@@ -42,8 +59,6 @@ def resize_image(image, desired_size, image_settings=[]):
 
     x_offset, y_offset = 0,0
     new_width, new_height = img_width,img_height
-    # Step 1: Determine crop dimensions
-    desired_ratio = desired_width / desired_height
     if img_ratio > desired_ratio:
         # Image is wider than desired aspect ratio
         new_width = int(img_height * desired_ratio)
@@ -55,38 +70,98 @@ def resize_image(image, desired_size, image_settings=[]):
         if not keep_width:
             y_offset = (img_height - new_height) // 2
 
+    return (x_offset, y_offset, x_offset + new_width, y_offset + new_height)
+
+def resize_image(image, desired_size, image_settings=[]):
+    desired_width, desired_height = desired_size
+    desired_width, desired_height = int(desired_width), int(desired_height)
+
+    # Step 1: Determine crop dimensions
+    box = get_crop_box(image.size, desired_size, image_settings)
+
     # Step 2: Crop the image
-    image = image.crop((x_offset, y_offset, x_offset + new_width, y_offset + new_height))
+    image = image.crop(box)
 
     # Step 3: Resize to the exact desired dimensions (if necessary)
     return image.resize((desired_width, desired_height), Image.LANCZOS)
 
+def _compose_transform(orientation, inverted, target_size):
+    """Returns the net rotation angle and the size to resize to before that rotation is applied."""
+    angle = get_orientation_angle(orientation, inverted)
+    width, height = int(target_size[0]), int(target_size[1])
+    if angle in (90, 270):
+        return angle, (height, width)
+    return angle, (width, height)
+
+def _unrotate_box(box, image_size, angle):
+    """Maps a box in the frame of the image rotated counter-clockwise by angle back onto the image."""
+    width, height = image_size
+    x0, y0, x1, y1 = box
+    if angle == 90:
+        return (width - y1, x0, width - y0, x1)
+    if angle == 180:
+        return (width - x1, height - y1, width - x0, height - y0)
+    if angle == 270:
+        return (y0, height - x1, y1, height - x0)
+    return box
+
+def orient_and_resize(image, orientation, desired_size, image_settings=[], inverted=False):
+    """Same result as change_orientation, resize_image and a 180 degree rotation when inverted, in one pass.
+
+    The crop box is computed in the oriented frame and mapped back onto the source image so the
+    crop and resize happen in a single resize call, followed by a single transpose of the resized image.
+    """
+    orientation_angle = get_orientation_angle(orientation)
+    angle, target_size = _compose_transform(orientation, inverted, desired_size)
+
+    width, height = image.size
+    oriented_size = (height, width) if orientation_angle in (90, 270) else (width, height)
+    box = get_crop_box(oriented_size, desired_size, image_settings)
+    box = _unrotate_box(box, image.size, orientation_angle)
+
+    # plugins usually render at the display resolution already, which needs no resampling
+    if box != (0, 0, width, height) or target_size != image.size:
+        image = image.resize(target_size, Image.LANCZOS, box=box, reducing_gap=2.0)
+    if angle:
+        image = image.transpose(ROTATIONS[angle])
+    return image
+
+# Image enhancements in the order they are applied, keyed by their image setting
+IMAGE_ENHANCEMENTS = (
+    ("brightness", ImageEnhance.Brightness),
+    ("contrast", ImageEnhance.Contrast),
+    ("saturation", ImageEnhance.Color),
+    ("sharpness", ImageEnhance.Sharpness)
+)
+
 def apply_image_enhancement(img, image_settings={}):
     # Convert image to RGB mode if necessary for enhancement operations
     # ImageEnhance requires RGB mode for operations like blend
     if img.mode not in ('RGB', 'L'):
         img = img.convert('RGB')
-        
-
-    # Apply Brightness
-    img = ImageEnhance.Brightness(img).enhance(image_settings.get("brightness", 1.0))
-
-    # Apply Contrast
-    img = ImageEnhance.Contrast(img).enhance(image_settings.get("contrast", 1.0))
-
-    # Apply Saturation (Color)
-    img = ImageEnhance.Color(img).enhance(image_settings.get("saturation", 1.0))
 
-    # Apply Sharpness
-    img = ImageEnhance.Sharpness(img).enhance(image_settings.get("sharpness", 1.0))
+    image_settings = image_settings or {}
+    for setting, enhancer in IMAGE_ENHANCEMENTS:
+        factor = image_settings.get(setting, 1.0)
+        # A factor of 1.0 returns the image unchanged, skip the full image pass
+        if factor != 1.0:
+            img = enhancer(img).enhance(factor)
 
     return img
 
 def compute_image_hash(image):
-    """Compute SHA-256 hash of an image."""
-    image = image.convert("RGB")
+    """Compute a hash of an image's RGB pixel data.
+
+    The hash is only used to detect whether an image changed, so the non-cryptographic
+    XXH3 hash is used when xxhash is installed, and BLAKE2b otherwise. It is persisted
+    in the device config so it must be stable across restarts.
+    """
+    if image.mode != "RGB":
+        image = image.convert("RGB")
     img_bytes = image.tobytes()
-    return hashlib.sha256(img_bytes).hexdigest()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(img_bytes)
+    return hashlib.blake2b(img_bytes, digest_size=32).hexdigest()
 
 def take_screenshot_html(html_str, dimensions, timeout_ms=None):
     image = None
@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+from PIL import Image
+
+from display.display_manager import DisplayManager
+
+
+class StubDeviceConfig:
+
+    def __init__(self, tmp_path):
+        self.config = {"display_type": "mock", "resolution": [16, 8], "output_dir": str(tmp_path / "mock_display_output")}
+        self.current_image_file = str(tmp_path / "current_image.png")
+
+    def get_config(self, key=None, default={}):
+        return self.config.get(key, default)
+
+    def get_resolution(self):
+        return self.config["resolution"]
+
+
+class FailingDisplay:
+
+    def __init__(self, device_config):
+        raise AttributeError("driver missing BLACK")
+
+
+class TestDisplayManager:
+
+    @pytest.fixture
+    def display_manager(self, tmp_path):
+        return DisplayManager(StubDeviceConfig(tmp_path))
+
+    def test_display_image_raises_driver_init_errors(self, display_manager):
+        display_manager._display_class = FailingDisplay
+
+        with pytest.raises(AttributeError, match="driver missing BLACK"):
+            display_manager.display_image(Image.new("RGB", (16, 8)))
+
+    def test_background_init_failure_is_logged(self, display_manager, caplog):
+        display_manager._display_class = FailingDisplay
+
+        with caplog.at_level(logging.ERROR, logger="display.display_manager"):
+            display_manager._init_display_in_background()
+
+        assert "Failed to initialize display" in caplog.text
+        assert display_manager._display is None
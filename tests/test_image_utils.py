@@ -0,0 +1,82 @@
+import pytest
+from PIL import Image, ImageChops, ImageEnhance
+
+from src.utils import image_utils
+from src.utils.image_utils import apply_image_enhancement, change_orientation, compute_image_hash, orient_and_resize, resize_image
+
+class TestComputeImageHash:
+
+    # Hashes are persisted in the device config, so both backends must keep producing these
+    EXPECTED_RED_HASHES = {
+        True: "e8c12a9ae0bc2563",
+        False: "811b4973b47dc037d2a78bec73c3d343b3ef8be29b91a4343eee91b82765a7b8",
+    }
+
+    @pytest.fixture(autouse=True, params=[True, False], ids=["xxhash", "blake2b"])
+    def xxhash_available(self, request, monkeypatch):
+        if request.param:
+            pytest.importorskip("xxhash")
+        monkeypatch.setattr(image_utils, "XXHASH_AVAILABLE", request.param)
+        return request.param
+
+    def test_hash_is_stable(self, xxhash_available):
+        assert compute_image_hash(Image.new("RGB", (16, 8), "red")) == self.EXPECTED_RED_HASHES[xxhash_available]
+
+    def test_identical_images_have_same_hash(self):
+        assert compute_image_hash(Image.new("RGB", (16, 8), "red")) == compute_image_hash(Image.new("RGB", (16, 8), "red"))
+
+    def test_different_images_have_different_hash(self):
+        assert compute_image_hash(Image.new("RGB", (16, 8), "red")) != compute_image_hash(Image.new("RGB", (16, 8), "blue"))
+
+    def test_hash_ignores_image_mode(self):
+        assert compute_image_hash(Image.new("RGBA", (16, 8), "red")) == compute_image_hash(Image.new("RGB", (16, 8), "red"))
+
+class TestOrientAndResize:
+
+    @pytest.mark.parametrize("orientation", ["horizontal", "vertical"])
+    @pytest.mark.parametrize("inverted", [False, True])
+    @pytest.mark.parametrize("image_settings", [[], ["keep-width"]])
+    def test_matches_separate_transforms(self, orientation, inverted, image_settings):
+        image = Image.merge("RGB", [Image.effect_noise((40, 30), 80) for _ in range(3)])
+        # crop only, so the single pass resize is pixel exact
+        desired_size = (40, 20) if orientation == "horizontal" else (30, 20)
+
+        expected = change_orientation(image, orientation)
+        expected = resize_image(expected, desired_size, image_settings)
+        if inverted:
+            expected = expected.rotate(180)
+
+        result = orient_and_resize(image, orientation, desired_size, image_settings, inverted=inverted)
+
+        assert result.size == expected.size
+        assert ImageChops.difference(result, expected).getbbox() is None
+
+    def test_image_at_display_resolution_is_not_resampled(self):
+        image = Image.new("RGB", (40, 30), "red")
+
+        assert orient_and_resize(image, "horizontal", (40, 30)) is image
+        assert orient_and_resize(image, "vertical", (30, 40)).size == (30, 40)
+
+class TestApplyImageEnhancement:
+
+    @pytest.mark.parametrize("image_settings", [None, {}, {"brightness": 1.0, "contrast": 1.0, "saturation": 1.0, "sharpness": 1.0, "inky_saturation": 0.5}])
+    def test_default_settings_return_image_unchanged(self, image_settings):
+        image = Image.new("RGB", (16, 8), "red")
+
+        assert apply_image_enhancement(image, image_settings) is image
+
+    def test_converts_to_rgb(self):
+        assert apply_image_enhancement(Image.new("RGBA", (16, 8), "red"), {}).mode == "RGB"
+
+    def test_matches_applying_each_enhancement(self):
+        image = Image.merge("RGB", [Image.effect_noise((16, 8), 80) for _ in range(3)])
+        image_settings = {"brightness": 1.2, "contrast": 1.0, "saturation": 0.8, "sharpness": 1.5}
+
+        expected = ImageEnhance.Brightness(image).enhance(1.2)
+        expected = ImageEnhance.Contrast(expected).enhance(1.0)
+        expected = ImageEnhance.Color(expected).enhance(0.8)
+        expected = ImageEnhance.Sharpness(expected).enhance(1.5)
+
+        result = apply_image_enhancement(image, image_settings)
+
+        assert ImageChops.difference(result, expected).getbbox() is None
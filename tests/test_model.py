@@ -1,6 +1,6 @@
 import pytest
 
-from src.model import Playlist
+from src.model import Playlist, RefreshInfo
 
 class TestPlaylist:
 
@@ -49,4 +49,13 @@ class TestPlaylist:
         playlist = Playlist("Test Playlist", start, end)
         assert playlist.is_active(current) == expected
         assert playlist.get_priority() == priority
-        
\ No newline at end of file
+        
+
+
+class TestRefreshInfo:
+
+    def test_repr_matches_to_dict(self):
+        info = RefreshInfo("Playlist", "clock", "2025-01-01T00:00:00+00:00", "abc", playlist="Default", plugin_instance="Clock")
+
+        assert repr(info) == repr(info.to_dict())
+        assert str(info) == repr(info.to_dict())
@@ -0,0 +1,304 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from PIL import Image, ImageChops
+
+import refresh_task
+from model import RefreshInfo
+from refresh_task import ManualRefresh, PlaylistRefresh, RefreshTask
+
+
+class StubPlugin:
+    """Plugin that renders a solid colour image."""
+
+    def __init__(self, color="red"):
+        self.color = color
+        self.config = {}
+        self.generated = 0
+
+    def generate_image(self, settings, device_config):
+        if settings.get("started"):
+            settings["started"].set()
+        if settings.get("gate"):
+            settings["gate"].wait(5)
+        if settings.get("error"):
+            raise RuntimeError(settings["error"])
+        self.generated += 1
+        return Image.new("RGB", (16, 8), settings.get("color", self.color))
+
+
+class StubPluginInstance:
+
+    def __init__(self, name="instance", due=True):
+        self.plugin_id = "stub"
+        self.name = name
+        self.settings = {}
+        self.latest_refresh_time = None
+        self.due = due
+
+    def should_refresh(self, current_dt):
+        return self.due
+
+    def get_image_path(self):
+        return f"{self.name}.png"
+
+
+class StubPlaylist:
+    name = "Default"
+
+
+class StubPlaylistManager:
+
+    def determine_active_playlist(self, current_dt):
+        return None
+
+
+class StubDeviceConfig:
+
+    def __init__(self, plugin_image_dir=None):
+        self.plugin_image_dir = str(plugin_image_dir)
+        self.config = {"timezone": "UTC"}
+        self.playlist_manager = StubPlaylistManager()
+        self.refresh_info = RefreshInfo(None, None, None, None)
+
+    def get_config(self, key=None, default={}):
+        return self.config.get(key, default)
+
+    def get_playlist_manager(self):
+        return self.playlist_manager
+
+    def get_refresh_info(self):
+        return self.refresh_info
+
+    def get_plugin(self, plugin_id):
+        return {"id": plugin_id}
+
+    def write_config(self):
+        pass
+
+
+class StubDisplayManager:
+
+    def __init__(self):
+        self.displayed = []
+
+    def display_image(self, image, image_settings=[], image_hash=None):
+        self.displayed.append(image.getpixel((0, 0)))
+
+
+@pytest.fixture(autouse=True)
+def reset_last_image():
+    PlaylistRefresh.last_image = (None, None, None)
+
+
+class TestPlaylistRefresh:
+
+    def test_not_due_refresh_reuses_last_generated_image(self, tmp_path):
+        device_config = StubDeviceConfig(tmp_path)
+        plugin = StubPlugin()
+        plugin_instance = StubPluginInstance()
+        now = datetime.now(timezone.utc)
+
+        generated = PlaylistRefresh(StubPlaylist(), plugin_instance).execute(plugin, device_config, now)
+        plugin_instance.due = False
+        reused = PlaylistRefresh(StubPlaylist(), plugin_instance).execute(plugin, device_config, now)
+
+        assert reused is generated
+        assert plugin.generated == 1
+
+    def test_not_due_refresh_reloads_image_when_file_changes(self, tmp_path):
+        device_config = StubDeviceConfig(tmp_path)
+        plugin_instance = StubPluginInstance()
+        now = datetime.now(timezone.utc)
+
+        generated = PlaylistRefresh(StubPlaylist(), plugin_instance).execute(StubPlugin(), device_config, now)
+        image_path = os.path.join(tmp_path, plugin_instance.get_image_path())
+        Image.new("RGB", (16, 8), "blue").save(image_path)
+        mtime = os.path.getmtime(image_path) + 10
+        os.utime(image_path, (mtime, mtime))
+
+        plugin_instance.due = False
+        reloaded = PlaylistRefresh(StubPlaylist(), plugin_instance).execute(StubPlugin(), device_config, now)
+
+        assert reloaded is not generated
+        assert ImageChops.difference(reloaded, Image.new("RGB", (16, 8), "blue")).getbbox() is None
+
+    def test_only_last_generated_image_is_kept(self, tmp_path):
+        device_config = StubDeviceConfig(tmp_path)
+        first_instance = StubPluginInstance("first")
+        now = datetime.now(timezone.utc)
+
+        first = PlaylistRefresh(StubPlaylist(), first_instance).execute(StubPlugin(), device_config, now)
+        PlaylistRefresh(StubPlaylist(), StubPluginInstance("second")).execute(StubPlugin("blue"), device_config, now)
+
+        first_instance.due = False
+        reloaded = PlaylistRefresh(StubPlaylist(), first_instance).execute(StubPlugin(), device_config, now)
+
+        assert reloaded is not first
+        assert ImageChops.difference(reloaded, first).getbbox() is None
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+class TestRefreshTask:
+
+    @pytest.fixture
+    def display_manager(self):
+        return StubDisplayManager()
+
+    @pytest.fixture
+    def task(self, monkeypatch, display_manager):
+        monkeypatch.setattr(refresh_task, "get_plugin_instance", lambda plugin_config: StubPlugin())
+        task = RefreshTask(StubDeviceConfig(), display_manager)
+        task.start()
+        yield task
+        task.stop()
+
+    def start_blocked_update(self, task, color="red"):
+        """Starts a manual update on another thread that blocks in the plugin until the returned gate is set."""
+        started, gate = threading.Event(), threading.Event()
+        caller = threading.Thread(target=task.manual_update, args=(ManualRefresh("stub", {"color": color, "started": started, "gate": gate}),))
+        caller.start()
+        assert started.wait(5)
+        return caller, gate
+
+    def queue_update(self, task, settings, errors):
+        """Queues a manual update on another thread, collecting any exception it raises."""
+        queued = task._queue.qsize() + 1
+
+        def update():
+            try:
+                task.manual_update(ManualRefresh("stub", settings))
+            except Exception as e:
+                errors.append(e)
+
+        caller = threading.Thread(target=update)
+        caller.start()
+        wait_until(lambda: task._queue.qsize() == queued)
+        return caller
+
+    def test_manual_update_displays_image(self, task, display_manager):
+        task.manual_update(ManualRefresh("stub", {"color": "red"}))
+
+        assert display_manager.displayed == [(255, 0, 0)]
+
+    def test_manual_update_reads_cycle_config_once(self, task, monkeypatch):
+        reads = []
+        get_config = task.device_config.get_config
+        monkeypatch.setattr(task.device_config, "get_config", lambda key=None, default={}: reads.append(key) or get_config(key, default))
+
+        task.manual_update(ManualRefresh("stub", {"color": "red"}))
+
+        assert reads.count("plugin_cycle_interval_seconds") == 1
+        assert "log_system_stats" not in reads
+
+    def test_queued_updates_are_processed_in_order(self, task, display_manager):
+        errors = []
+        blocked, gate = self.start_blocked_update(task, "red")
+        callers = [self.queue_update(task, {"color": color}, errors) for color in ("lime", "blue", "white")]
+
+        gate.set()
+        for caller in [blocked, *callers]:
+            caller.join(5)
+
+        assert errors == []
+        assert display_manager.displayed == [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
+
+    def test_pending_request_is_not_replaced_by_a_newer_one(self, task, display_manager):
+        errors = []
+        blocked, gate = self.start_blocked_update(task, "red")
+        first = self.queue_update(task, {"color": "lime"}, errors)
+        second = self.queue_update(task, {"color": "blue"}, errors)
+
+        gate.set()
+        for caller in (blocked, first, second):
+            caller.join(5)
+            assert not caller.is_alive()
+
+        assert errors == []
+        assert (0, 255, 0) in display_manager.displayed
+        assert (0, 0, 255) in display_manager.displayed
+
+    def test_exception_reaches_caller(self, task):
+        with pytest.raises(RuntimeError, match="plugin failed"):
+            task.manual_update(ManualRefresh("stub", {"error": "plugin failed"}))
+
+    def test_timeout(self, task):
+        started, gate = threading.Event(), threading.Event()
+
+        with pytest.raises(TimeoutError):
+            task.manual_update(ManualRefresh("stub", {"started": started, "gate": gate}), timeout=0.05)
+        gate.set()
+
+    def test_timed_out_request_that_has_not_started_is_skipped(self, task, display_manager):
+        blocked, gate = self.start_blocked_update(task, "red")
+
+        with pytest.raises(TimeoutError, match="cancelled"):
+            task.manual_update(ManualRefresh("stub", {"color": "blue"}), timeout=0.05)
+        gate.set()
+        blocked.join(5)
+        task.manual_update(ManualRefresh("stub", {"color": "lime"}))
+
+        assert display_manager.displayed == [(255, 0, 0), (0, 255, 0)]
+
+    @pytest.mark.parametrize("error", [None, "boom"])
+    def test_refresh_finishing_as_the_wait_times_out_is_not_a_timeout(self, task, display_manager, monkeypatch, error):
+        class LateEvent(threading.Event):
+            """Reports a timeout only once the refresh has finished, as if it completed right after the wait."""
+            def wait(self, timeout=None):
+                super().wait(5)
+                return False
+
+        class LateRequest(refresh_task.ManualUpdateRequest):
+            def __init__(self, refresh_action):
+                super().__init__(refresh_action)
+                self.done = LateEvent()
+
+        monkeypatch.setattr(refresh_task, "ManualUpdateRequest", LateRequest)
+
+        if error:
+            with pytest.raises(RuntimeError, match=error):
+                task.manual_update(ManualRefresh("stub", {"error": error}), timeout=0.05)
+        else:
+            task.manual_update(ManualRefresh("stub", {"color": "red"}), timeout=0.05)
+            assert display_manager.displayed == [(255, 0, 0)]
+
+    def test_timeout_defaults_to_config(self, task):
+        task.device_config.config["manual_update_timeout_seconds"] = 0.05
+        started, gate = threading.Event(), threading.Event()
+
+        with pytest.raises(TimeoutError):
+            task.manual_update(ManualRefresh("stub", {"started": started, "gate": gate}))
+        gate.set()
+
+    def test_stop_releases_queued_callers(self, task, display_manager):
+        errors = []
+        blocked, gate = self.start_blocked_update(task, "red")
+        queued = self.queue_update(task, {"color": "blue"}, errors)
+
+        stopper = threading.Thread(target=task.stop)
+        stopper.start()
+        wait_until(lambda: not task.running)
+        gate.set()
+        for thread in (blocked, queued, stopper):
+            thread.join(5)
+
+        assert display_manager.displayed == [(255, 0, 0)]
+        assert len(errors) == 1
+        assert isinstance(errors[0], RuntimeError)
+
+    def test_manual_update_after_stop_is_not_queued(self, task, display_manager):
+        task.stop()
+
+        task.manual_update(ManualRefresh("stub", {"color": "red"}), timeout=1)
+
+        assert task._queue.qsize() == 0
+        assert display_manager.displayed == []